@@ -1,9 +1,16 @@
 """Agent discovery and loading."""
 
+import os
 from pathlib import Path
 from typing import Optional
 import yaml
 
+try:
+    # libyaml-backed loader is ~10x faster than the pure-Python one
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 from ..types import Agent, AgentConfig, RoleType
 from ..config import (
     get_package_defaults_dir,
@@ -12,38 +19,10 @@ from ..config import (
 )
 
 
-def load_agent_prompt(agent_name: str, search_dirs: list[Path]) -> Optional[str]:
-    """Load agent prompt from prompt.md, searching in order."""
-    for base_dir in search_dirs:
-        prompt_path = base_dir / "agents" / agent_name / "prompt.md"
-        if prompt_path.exists():
-            with open(prompt_path, "r") as f:
-                return f.read()
-    return None
-
-
-def load_agent_config(
-    agent_name: str, search_dirs: list[Path]
-) -> Optional[AgentConfig]:
-    """Load agent config from agent.yaml, searching in order."""
-    for base_dir in search_dirs:
-        config_path = base_dir / "agents" / agent_name / "agent.yaml"
-        if config_path.exists():
-            with open(config_path, "r") as f:
-                data = yaml.safe_load(f)
-                if data:
-                    agent_type = RoleType(data.get("type", "implementer"))
-                    return AgentConfig(
-                        type=agent_type,
-                        stance=data.get("stance"),
-                        context=data.get("context", []),
-                    )
-    return None
-
-
-def discover_agent_names() -> set[str]:
+def discover_agent_names() -> frozenset[str]:
     """Discover all available agent names from all config directories."""
-    agent_names = set()
+    # dict keys keep insertion order for deterministic logging of discovery
+    agent_names: dict[str, None] = {}
 
     search_dirs = [
         get_package_defaults_dir(),
@@ -52,15 +31,20 @@ def discover_agent_names() -> set[str]:
     ]
 
     for base_dir in search_dirs:
-        agents_dir = base_dir / "agents"
-        if agents_dir.exists() and agents_dir.is_dir():
-            for agent_dir in agents_dir.iterdir():
-                if agent_dir.is_dir():
-                    # Check if it has a prompt.md
-                    if (agent_dir / "prompt.md").exists():
-                        agent_names.add(agent_dir.name)
-
-    return agent_names
+        try:
+            entries = os.scandir(base_dir / "agents")
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with entries:
+            for entry in entries:
+                # Only agent dirs with a prompt.md count; scandir's cached
+                # d_type avoids a stat per entry.
+                if entry.is_dir(follow_symlinks=False) and os.path.isfile(
+                    os.path.join(entry.path, "prompt.md")
+                ):
+                    agent_names[entry.name] = None
+
+    return frozenset(agent_names)
 
 
 def load_agent(agent_name: str, role_type: RoleType) -> Agent:
@@ -76,13 +60,30 @@ def load_agent(agent_name: str, role_type: RoleType) -> Agent:
         get_package_defaults_dir(),
     ]
 
-    # Load prompt (project overrides user overrides defaults)
-    prompt = load_agent_prompt(agent_name, search_dirs)
-    if not prompt:
-        raise ValueError(f"Agent '{agent_name}' not found - no prompt.md exists")
+    # Single pass over search_dirs: each agent dir is listed once and both
+    # prompt.md and agent.yaml are picked up together (project overrides
+    # user overrides defaults).
+    prompt_path: Optional[Path] = None
+    config: Optional[AgentConfig] = None
 
-    # Load config (if exists)
-    config = load_agent_config(agent_name, search_dirs)
+    for base_dir in search_dirs:
+        agent_dir = os.path.join(str(base_dir), "agents", agent_name)
+        try:
+            entries = os.listdir(agent_dir)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+        if prompt_path is None and "prompt.md" in entries:
+            prompt_path = Path(agent_dir) / "prompt.md"
+
+        if config is None and "agent.yaml" in entries:
+            config = _load_config_file(Path(agent_dir) / "agent.yaml")
+
+        if prompt_path is not None and config is not None:
+            break
+
+    if prompt_path is None:
+        raise ValueError(f"Agent '{agent_name}' not found - no prompt.md exists")
 
     # Use role_type from config if available, otherwise use passed-in type
     if config and config.type:
@@ -90,15 +91,96 @@ def load_agent(agent_name: str, role_type: RoleType) -> Agent:
     else:
         actual_type = role_type
 
-    return Agent(name=agent_name, type=actual_type, prompt=prompt, config=config)
+    return Agent(
+        name=agent_name, type=actual_type, prompt_path=prompt_path, config=config
+    )
+
+
+def _build_agent_index(
+    search_dirs: list[Path],
+) -> dict[str, tuple[Optional[Path], list[Path]]]:
+    """Scan each agents/ dir once, mapping agent name to its prompt path and
+    agent.yaml candidates in precedence order.
+
+    Earlier search_dirs take precedence, matching load_agent's search order.
+    All agent.yaml candidates are kept so an empty higher-precedence file
+    falls through to a lower one, just as load_agent's own search does.
+    """
+    index: dict[str, tuple[Optional[Path], list[Path]]] = {}
+
+    for base_dir in search_dirs:
+        try:
+            entries = os.scandir(base_dir / "agents")
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                try:
+                    files = os.listdir(entry.path)
+                except OSError:
+                    continue
+                prompt_path, yaml_paths = index.get(entry.name, (None, []))
+                if prompt_path is None and "prompt.md" in files:
+                    prompt_path = Path(entry.path) / "prompt.md"
+                if "agent.yaml" in files:
+                    yaml_paths.append(Path(entry.path) / "agent.yaml")
+                index[entry.name] = (prompt_path, yaml_paths)
+
+    return index
+
+
+def _load_config_file(yaml_path: Path) -> Optional[AgentConfig]:
+    """Parse an agent.yaml file into an AgentConfig."""
+    with open(yaml_path, "r") as f:
+        data = yaml.load(f, Loader=_SafeLoader)
+    if not data:
+        return None
+    return AgentConfig(
+        type=RoleType(data.get("type", "implementer")),
+        stance=data.get("stance"),
+        context=tuple(data.get("context", ())),
+    )
 
 
 def load_all_agents(workflow_roles: list) -> dict[str, Agent]:
     """Load all agents needed for the workflow."""
-    agents = {}
+    search_dirs = [
+        get_project_config_dir(),
+        get_user_config_dir(),
+        get_package_defaults_dir(),
+    ]
+
+    # One directory scan per base_dir instead of one walk per role.
+    index = _build_agent_index(search_dirs)
 
+    agents = {}
     for workflow_role in workflow_roles:
-        agent = load_agent(workflow_role.role, workflow_role.type)
-        agents[workflow_role.role] = agent
+        prompt_path, yaml_paths = index.get(workflow_role.role, (None, []))
+        if prompt_path is None:
+            raise ValueError(
+                f"Agent '{workflow_role.role}' not found - no prompt.md exists"
+            )
+
+        config = None
+        for yaml_path in yaml_paths:
+            config = _load_config_file(yaml_path)
+            if config is not None:
+                break
+
+        # Use role_type from config if available, otherwise the workflow's
+        if config and config.type:
+            actual_type = config.type
+        else:
+            actual_type = workflow_role.type
+
+        # The prompt itself is read lazily on first Agent.prompt access
+        agents[workflow_role.role] = Agent(
+            name=workflow_role.role,
+            type=actual_type,
+            prompt_path=prompt_path,
+            config=config,
+        )
 
     return agents
@@ -1,10 +1,19 @@
 """Configuration loading and management for Team MCP."""
 
+import copy
+import functools
 import os
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 import yaml
 
+try:
+    # libyaml-backed loader is ~10x faster than the pure-Python one
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 from .types import (
     Config,
     WorkflowConfig,
@@ -16,40 +25,70 @@ from .types import (
 )
 
 
+@functools.lru_cache(maxsize=1)
 def get_package_defaults_dir() -> Path:
     """Get the package defaults directory."""
     return Path(__file__).parent / "defaults"
 
 
+@functools.lru_cache(maxsize=1)
 def get_user_config_dir() -> Path:
     """Get the user's global config directory."""
     return Path.home() / ".team-mcp"
 
 
+@functools.lru_cache(maxsize=1)
 def get_project_config_dir() -> Path:
     """Get the project's local config directory."""
     return Path.cwd() / ".team"
 
 
 def deep_merge(base: dict, override: dict) -> dict:
-    """Deep merge two dictionaries, with override taking precedence."""
-    result = base.copy()
+    """Deep merge override into base, with override taking precedence.
+
+    Mutates and returns base; callers that need the original must copy it
+    first (load_yaml_config already hands out fresh copies).
+    """
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
+        existing = base.get(key)
+        if isinstance(existing, dict) and isinstance(value, dict):
+            deep_merge(existing, value)
         else:
-            result[key] = value
-    return result
+            base[key] = value
+    return base
+
+
+# Parsed YAML keyed by path, invalidated when the file's mtime/size change.
+_YAML_CACHE: dict[Path, tuple[int, int, dict]] = {}
 
 
 def load_yaml_config(path: Path) -> dict:
-    """Load a YAML configuration file."""
-    if not path.exists():
+    """Load a YAML configuration file, reusing the parse for unchanged files."""
+    try:
+        st = path.stat()
+    except OSError:
         return {}
 
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return copy.deepcopy(cached[2])
+
     with open(path, "r") as f:
-        data = yaml.safe_load(f)
-        return data if data is not None else {}
+        data = yaml.load(f, Loader=_SafeLoader)
+        data = data if data is not None else {}
+
+    _YAML_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return copy.deepcopy(data)
+
+
+# Maps raw config strings to enum members, skipping Enum.__call__ per entry
+_ROLE_TYPE_CACHE: dict[str, RoleType] = {rt.value: rt for rt in RoleType}
+
+
+def _parse_role_type(role_type_str: str) -> RoleType:
+    """Resolve a role-type string, raising ValueError for unknown values."""
+    role_type = _ROLE_TYPE_CACHE.get(role_type_str)
+    return role_type if role_type is not None else RoleType(role_type_str)
 
 
 def parse_workflow_config(data: dict) -> WorkflowConfig:
@@ -59,8 +98,12 @@ def parse_workflow_config(data: dict) -> WorkflowConfig:
 
     for role_data in sequence_data:
         role_type_str = role_data.get("type", "implementer")
-        role_type = RoleType(role_type_str)
-        sequence.append(WorkflowRole(role=role_data["role"], type=role_type))
+        role_type = _parse_role_type(role_type_str)
+        # Role names are compared constantly downstream; intern them here
+        # since WorkflowRole tuples are immutable once built
+        sequence.append(
+            WorkflowRole(role=sys.intern(role_data["role"]), type=role_type)
+        )
 
     rebound_config = data.get("rebound", {})
 
@@ -96,11 +139,11 @@ def parse_agents_config(data: dict) -> dict[str, AgentConfig]:
     for agent_name, agent_data in data.items():
         if isinstance(agent_data, dict):
             agent_type_str = agent_data.get("type", "implementer")
-            agent_type = RoleType(agent_type_str)
+            agent_type = _parse_role_type(agent_type_str)
             agents[agent_name] = AgentConfig(
                 type=agent_type,
                 stance=agent_data.get("stance"),
-                context=agent_data.get("context", []),
+                context=tuple(agent_data.get("context", ())),
             )
     return agents
 
@@ -112,15 +155,15 @@ def load_config() -> Config:
     defaults_config_path = get_package_defaults_dir() / "config.yaml"
     config_data = load_yaml_config(defaults_config_path)
 
-    # Layer 2: User global config
+    # Layer 2: User global config (skip the merge when absent)
     user_config_path = get_user_config_dir() / "config.yaml"
-    user_config_data = load_yaml_config(user_config_path)
-    config_data = deep_merge(config_data, user_config_data)
+    if user_config_path.exists():
+        config_data = deep_merge(config_data, load_yaml_config(user_config_path))
 
     # Layer 3: Project local config
     project_config_path = get_project_config_dir() / "config.yaml"
-    project_config_data = load_yaml_config(project_config_path)
-    config_data = deep_merge(config_data, project_config_data)
+    if project_config_path.exists():
+        config_data = deep_merge(config_data, load_yaml_config(project_config_path))
 
     # Parse into Config object
     workflow_data = config_data.get("workflow", {})
@@ -131,31 +174,34 @@ def load_config() -> Config:
     return Config(
         version=config_data.get("version", 1),
         workflow=parse_workflow_config(workflow_data),
-        rules=config_data.get("rules", []),
+        rules=tuple(config_data.get("rules", ())),
         context=config_data.get("context", {}),
         git=parse_git_config(git_data),
         output=parse_output_config(output_data),
         agents=parse_agents_config(agents_data),
+        debug_pretty_json=config_data.get("debug_pretty_json", False),
+        context_cache_ttl=config_data.get("context_cache_ttl", 5.0),
     )
 
 
-def get_context_files(role: str, config: Config) -> list[str]:
-    """Get context files for a specific role."""
-    context_files = []
-
-    # Always-included context
-    if "always" in config.context:
-        context_files.extend(config.context["always"])
+@functools.lru_cache(maxsize=64)
+def _get_context_files(
+    always: tuple[str, ...], role_context: tuple[str, ...]
+) -> tuple[str, ...]:
+    """Combine always-included and role-specific context patterns."""
+    return always + role_context
 
-    # Role-specific context
-    if role in config.context:
-        context_files.extend(config.context[role])
 
-    return context_files
+def get_context_files(role: str, config: Config) -> tuple[str, ...]:
+    """Get context file patterns for a specific role."""
+    return _get_context_files(
+        tuple(config.context.get("always", ())),
+        tuple(config.context.get(role, ())),
+    )
 
 
 def expand_glob_patterns(
-    patterns: list[str], base_dir: Optional[Path] = None
+    patterns: Sequence[str], base_dir: Optional[Path] = None
 ) -> list[str]:
     """Expand glob patterns to actual file paths."""
     if base_dir is None:
@@ -163,24 +209,17 @@ def expand_glob_patterns(
 
     expanded = []
     for pattern in patterns:
-        pattern_path = base_dir / pattern
-        parent = pattern_path.parent
-
-        if "*" in str(pattern):
-            # Glob pattern
-            if "**" in str(pattern):
-                # Recursive glob
-                for match in base_dir.glob(pattern):
-                    if match.is_file():
-                        expanded.append(str(match.relative_to(base_dir)))
-            else:
-                # Non-recursive glob
-                for match in parent.glob(pattern_path.name):
-                    if match.is_file():
-                        expanded.append(str(match.relative_to(base_dir)))
+        if "*" in pattern:
+            # Glob pattern (Path.glob handles ** recursion itself)
+            for match in base_dir.glob(pattern):
+                if match.is_file():
+                    expanded.append(str(match.relative_to(base_dir)))
         else:
             # Literal path
-            if pattern_path.is_file():
-                expanded.append(pattern)
+            try:
+                if (base_dir / pattern).is_file():
+                    expanded.append(pattern)
+            except OSError:
+                pass
 
     return expanded
@@ -1,5 +1,6 @@
 """Git integration for Team MCP."""
 
+import os
 import subprocess
 from pathlib import Path
 from typing import Optional
@@ -12,6 +13,12 @@ class GitIntegration:
 
     def __init__(self, config: GitConfig):
         self.config = config
+        self._msg_fmt = config.commit_message_format
+        self._cwd = Path.cwd()
+        # Force the C locale so git's output stays parseable regardless of
+        # the user's LANG/LC_ALL
+        self._env = {**os.environ, "LC_ALL": "C"}
+        self._is_repo: Optional[bool] = None
         self.current_branch: Optional[str] = None
         self.original_branch: Optional[str] = None
 
@@ -22,16 +29,39 @@ class GitIntegration:
                 ["git"] + list(args),
                 capture_output=True,
                 text=True,
-                cwd=Path.cwd(),
+                stdin=subprocess.DEVNULL,
+                cwd=self._cwd,
+                env=self._env,
             )
             return result.returncode, result.stdout.strip(), result.stderr.strip()
         except Exception as e:
             return 1, "", str(e)
 
+    def _run_git_quiet(self, *args: str) -> int:
+        """Run a git command discarding output and return its exit code.
+
+        Skips the pipe setup and decoding of _run_git for commands whose
+        output we never read (add, checkout, ...).
+        """
+        try:
+            result = subprocess.run(
+                ["git"] + list(args),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                cwd=self._cwd,
+                env=self._env,
+            )
+            return result.returncode
+        except Exception:
+            return 1
+
     def is_git_repo(self) -> bool:
-        """Check if current directory is a git repository."""
-        returncode, _, _ = self._run_git("rev-parse", "--git-dir")
-        return returncode == 0
+        """Check if current directory is a git repository (cached)."""
+        if self._is_repo is None:
+            returncode, _, _ = self._run_git("rev-parse", "--git-dir")
+            self._is_repo = returncode == 0
+        return self._is_repo
 
     def get_current_branch(self) -> Optional[str]:
         """Get the current git branch."""
@@ -54,7 +84,7 @@ class GitIntegration:
 
             # Create new branch
             branch_name = f"{self.config.branch_prefix}{task_id}"
-            returncode, _, _ = self._run_git("checkout", "-b", branch_name)
+            returncode = self._run_git_quiet("checkout", "-b", branch_name)
             if returncode == 0:
                 self.current_branch = branch_name
                 return True
@@ -77,26 +107,26 @@ class GitIntegration:
         if not self.is_git_repo():
             return False
 
-        # Stage files
+        # Stage files in one git invocation instead of one per file
         if files:
-            for file in files:
-                self._run_git("add", file)
+            self._run_git_quiet("add", "--", *files)
         else:
             # Stage all changes
-            self._run_git("add", "-A")
-
-        # Check if there are changes to commit
-        returncode, stdout, _ = self._run_git("diff", "--cached", "--quiet")
-        if returncode == 0:
-            # No changes to commit
-            return True
+            self._run_git_quiet("add", "-A")
 
         # Format commit message
-        message = self.config.commit_message_format.format(role=role, summary=summary)
+        message = self._msg_fmt.format(role=role, summary=summary)
 
-        # Commit
-        returncode, _, _ = self._run_git("commit", "-m", message)
-        return returncode == 0
+        # Commit directly; an empty index is detected from git's own output
+        # instead of a separate 'git diff --cached --quiet' invocation.
+        # _run_git forces LC_ALL=C, so the messages are locale-stable.
+        returncode, stdout, stderr = self._run_git("commit", "-m", message)
+        if returncode == 0:
+            return True
+        output = stdout + stderr
+        if "nothing to commit" in output or "no changes added to commit" in output:
+            return True
+        return False
 
     def complete_run(self) -> bool:
         """Complete a run - commit final state if in current mode."""
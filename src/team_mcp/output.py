@@ -2,9 +2,143 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, TextIO
+
+from .types import (
+    ROLE_TYPE_VALUES,
+    Task,
+    TaskComplete,
+    RoleType,
+    Submission,
+    OutputConfig,
+)
+
+_DT_FMT = "%Y-%m-%d %H:%M:%S"
+
+
+def _fmt(dt: datetime) -> str:
+    """Format a timestamp for display in run artifacts."""
+    return dt.strftime(_DT_FMT)
+
+
+def _format_outcome(submission: Submission) -> str:
+    """Format outcome for display."""
+    if submission.outcome == "confirmed":
+        return "✅ Requirements confirmed"
+    elif submission.outcome == "submitted":
+        return "✅ Design submitted"
+    elif submission.outcome == "paused":
+        return "⏸ Paused for user input"
+    elif submission.outcome == "approved":
+        return "✅ Approved"
+    elif submission.outcome == "rejected":
+        return "❌ Rejected"
+    else:
+        return submission.outcome or "N/A"
+
+
+def _gatekeeper_row(sub: Submission) -> str:
+    """Summary table row for a gatekeeper decision."""
+    approved = sub.data.get("approved", False)
+    outcome = "✅ Approved" if approved else "❌ Rejected"
+    reason = sub.data.get("reason", "")
+    if not approved and reason:
+        outcome += f" — {reason[:50]}"
+    return f"| {sub.iteration} | {sub.role} | {outcome} |\n"
+
+
+# Summary table row formatter per role type
+_ROW_FMT: dict[RoleType, Callable[[Submission], str]] = {
+    RoleType.ANALYST: lambda s: f"| - | {s.role} | {_format_outcome(s)} |\n",
+    RoleType.DESIGNER: lambda s: f"| - | {s.role} | {_format_outcome(s)} |\n",
+    RoleType.IMPLEMENTER: lambda s: f"| {s.iteration} | {s.role} | Submitted |\n",
+    RoleType.GATEKEEPER: _gatekeeper_row,
+}
+
+
+def _iter_implementer(submission: Submission, f: TextIO) -> None:
+    """Iteration body for an implementer submission."""
+    f.write(f"""## Summary
 
-from .types import Task, TaskComplete, RoleType, Submission, OutputConfig
+{submission.data.get("summary", "N/A")}
+
+## Files Changed
+
+""")
+    for file in submission.data.get("files_changed", []):
+        f.write(f"- {file}\n")
+
+    f.write(f"""
+## Proof
+
+```
+{submission.data.get("proof", "N/A")}
+```
+
+""")
+    if "concerns" in submission.data:
+        f.write(f"""## Concerns
+
+{submission.data["concerns"]}
+""")
+
+
+def _iter_gatekeeper(submission: Submission, f: TextIO) -> None:
+    """Iteration body for a gatekeeper decision."""
+    approved = submission.data.get("approved", False)
+    f.write(f"""## Decision
+
+**Approved:** {"✅ Yes" if approved else "❌ No"}
+
+## Reason
+
+{submission.data.get("reason", "N/A")}
+
+""")
+    if not approved and "issues" in submission.data:
+        f.write("## Issues\n\n")
+        for issue in submission.data["issues"]:
+            f.write(f"- {issue}\n")
+
+
+def _iter_designer(submission: Submission, f: TextIO) -> None:
+    """Iteration body for a designer submission."""
+    f.write(f"""## Design
+
+{submission.data.get("design", "N/A")}
+
+## Patterns
+
+""")
+    for pattern in submission.data.get("patterns", []):
+        f.write(f"- {pattern}\n")
+
+    if "warnings" in submission.data:
+        f.write("\n## Warnings\n\n")
+        for warning in submission.data["warnings"]:
+            f.write(f"- {warning}\n")
+
+
+def _iter_analyst(submission: Submission, f: TextIO) -> None:
+    """Iteration body for an analyst submission."""
+    if "questions" in submission.data:
+        f.write("## Questions\n\n")
+        for question in submission.data["questions"]:
+            f.write(f"- {question}\n")
+    elif "confirmed_requirements" in submission.data:
+        f.write(f"""## Confirmed Requirements
+
+{submission.data["confirmed_requirements"]}
+""")
+
+
+# Iteration body builder per role type
+_ITER_BUILDERS: dict[RoleType, Callable[[Submission, TextIO], None]] = {
+    RoleType.IMPLEMENTER: _iter_implementer,
+    RoleType.GATEKEEPER: _iter_gatekeeper,
+    RoleType.DESIGNER: _iter_designer,
+    RoleType.ANALYST: _iter_analyst,
+}
 
 
 class OutputManager:
@@ -29,7 +163,7 @@ class OutputManager:
 
 {task.description}
 
-**Started:** {task.created_at.strftime("%Y-%m-%d %H:%M:%S")}
+**Started:** {_fmt(task.created_at)}
 **Task ID:** {task.id}
 """
         (run_dir / "task.md").write_text(task_md)
@@ -46,7 +180,7 @@ class OutputManager:
         requirements_md = f"""# Requirements
 
 **Confirmed by:** BA
-**Date:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+**Date:** {_fmt(datetime.now())}
 
 {task.confirmed_requirements}
 """
@@ -61,7 +195,7 @@ class OutputManager:
         design_md = f"""# Design
 
 **Created by:** Architect
-**Date:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+**Date:** {_fmt(datetime.now())}
 
 {task.current_design}
 """
@@ -76,179 +210,76 @@ class OutputManager:
         filename = f"{submission.iteration:02d}_{submission.role}.md"
         filepath = iterations_dir / filename
 
-        # Build content based on role type
-        content = f"""# {submission.role.upper()} - Iteration {submission.iteration}
+        # Stream the common header, then dispatch to the per-role-type builder
+        with filepath.open("w", encoding="utf-8") as f:
+            f.write(f"""# {submission.role.upper()} - Iteration {submission.iteration}
 
-**Role Type:** {submission.role_type.value}
-**Timestamp:** {submission.timestamp.strftime("%Y-%m-%d %H:%M:%S")}
+**Role Type:** {ROLE_TYPE_VALUES[submission.role_type]}
+**Timestamp:** {_fmt(submission.timestamp)}
 **Outcome:** {submission.outcome or "N/A"}
 
-"""
-
-        if submission.role_type == RoleType.IMPLEMENTER:
-            content += f"""## Summary
-
-{submission.data.get("summary", "N/A")}
-
-## Files Changed
-
-"""
-            files = submission.data.get("files_changed", [])
-            for file in files:
-                content += f"- {file}\n"
-
-            content += f"""
-## Proof
-
-```
-{submission.data.get("proof", "N/A")}
-```
-
-"""
-            if "concerns" in submission.data:
-                content += f"""## Concerns
-
-{submission.data["concerns"]}
-"""
-
-        elif submission.role_type == RoleType.GATEKEEPER:
-            approved = submission.data.get("approved", False)
-            content += f"""## Decision
-
-**Approved:** {"✅ Yes" if approved else "❌ No"}
-
-## Reason
-
-{submission.data.get("reason", "N/A")}
-
-"""
-            if not approved and "issues" in submission.data:
-                content += """## Issues
-
-"""
-                for issue in submission.data["issues"]:
-                    content += f"- {issue}\n"
+""")
 
-        elif submission.role_type == RoleType.DESIGNER:
-            content += f"""## Design
-
-{submission.data.get("design", "N/A")}
-
-## Patterns
-
-"""
-            for pattern in submission.data.get("patterns", []):
-                content += f"- {pattern}\n"
-
-            if "warnings" in submission.data:
-                content += "\n## Warnings\n\n"
-                for warning in submission.data["warnings"]:
-                    content += f"- {warning}\n"
-
-        elif submission.role_type == RoleType.ANALYST:
-            if "questions" in submission.data:
-                content += "## Questions\n\n"
-                for question in submission.data["questions"]:
-                    content += f"- {question}\n"
-            elif "confirmed_requirements" in submission.data:
-                content += f"""## Confirmed Requirements
-
-{submission.data["confirmed_requirements"]}
-"""
-
-        filepath.write_text(content)
+            builder = _ITER_BUILDERS.get(submission.role_type)
+            if builder is not None:
+                builder(submission, f)
 
     def write_summary(self, task: Task, result: TaskComplete) -> None:
         """Write final summary."""
         run_dir = self._ensure_run_dir(task.id)
 
-        # Build iterations table
-        iterations_table = "| # | Role | Outcome |\n|---|------|---------|\n"
-
-        # Group submissions by role type for summary
-        for sub in task.submissions:
-            if sub.role_type == RoleType.ANALYST:
-                iterations_table += (
-                    f"| - | {sub.role} | {self._format_outcome(sub)} |\n"
-                )
-            elif sub.role_type == RoleType.DESIGNER:
-                iterations_table += (
-                    f"| - | {sub.role} | {self._format_outcome(sub)} |\n"
-                )
-            elif sub.role_type == RoleType.IMPLEMENTER:
-                iterations_table += f"| {sub.iteration} | {sub.role} | Submitted |\n"
-            elif sub.role_type == RoleType.GATEKEEPER:
-                approved = sub.data.get("approved", False)
-                outcome = "✅ Approved" if approved else "❌ Rejected"
-                reason = sub.data.get("reason", "")
-                if not approved and reason:
-                    outcome += f" — {reason[:50]}"
-                iterations_table += f"| {sub.iteration} | {sub.role} | {outcome} |\n"
-
-        # Count coder iterations
-        coder_iterations = len(
-            [s for s in task.submissions if s.role_type == RoleType.IMPLEMENTER]
+        # Build iterations table in one pass via the per-role-type formatters
+        iterations_table = "| # | Role | Outcome |\n|---|------|---------|\n" + "".join(
+            [_ROW_FMT[sub.role_type](sub) for sub in task.submissions]
         )
 
-        summary_md = f"""# Run Summary
+        # Count coder iterations from the per-type index
+        coder_iterations = len(task.submissions_by_type.get(RoleType.IMPLEMENTER, ()))
+
+        # Stream the summary; fragments go straight to disk
+        with (run_dir / "summary.md").open("w", encoding="utf-8") as f:
+            f.write(f"""# Run Summary
 
 ## Task
 {task.description}
 
 ## Result: {"✅ SUCCESS" if result.success else "❌ FAILED"}
 
-"""
+""")
 
-        if task.confirmed_requirements:
-            summary_md += f"""## Requirements (from BA)
+            if task.confirmed_requirements:
+                f.write(f"""## Requirements (from BA)
 {task.confirmed_requirements}
 
-"""
+""")
 
-        if task.current_design:
-            summary_md += f"""## Design (from Architect)
+            if task.current_design:
+                f.write(f"""## Design (from Architect)
 {task.current_design}
 
-"""
+""")
 
-        summary_md += f"""## Iterations
+            f.write(f"""## Iterations
 
 {iterations_table}
 
 **Coder iterations:** {coder_iterations}
 
 ## Files Changed
-"""
+""")
 
-        for file in result.files_changed:
-            summary_md += f"- {file}\n"
+            for file in result.files_changed:
+                f.write(f"- {file}\n")
 
-        if result.git_branch:
-            summary_md += f"""
+            if result.git_branch:
+                f.write(f"""
 ## Git
 - **Branch:** `{result.git_branch}`
 - **Merge:** `git checkout main && git merge {result.git_branch}`
-"""
+""")
 
-        summary_md += f"""
+            f.write(f"""
 ## Timeline
-- **Started:** {task.created_at.strftime("%Y-%m-%d %H:%M:%S")}
-- **Completed:** {task.completed_at.strftime("%Y-%m-%d %H:%M:%S") if task.completed_at else "N/A"}
-"""
-
-        (run_dir / "summary.md").write_text(summary_md)
-
-    def _format_outcome(self, submission: Submission) -> str:
-        """Format outcome for display."""
-        if submission.outcome == "confirmed":
-            return "✅ Requirements confirmed"
-        elif submission.outcome == "submitted":
-            return "✅ Design submitted"
-        elif submission.outcome == "paused":
-            return "⏸ Paused for user input"
-        elif submission.outcome == "approved":
-            return "✅ Approved"
-        elif submission.outcome == "rejected":
-            return "❌ Rejected"
-        else:
-            return submission.outcome or "N/A"
+- **Started:** {_fmt(task.created_at)}
+- **Completed:** {_fmt(task.completed_at) if task.completed_at else "N/A"}
+""")
@@ -1,8 +1,12 @@
 """MCP server for Team MCP."""
 
 import asyncio
+import functools
+import itertools
+import operator
 import json
-from typing import Any
+import weakref
+from typing import Any, Awaitable, Callable
 
 from mcp.server import Server
 from mcp.types import Tool, TextContent
@@ -19,8 +23,33 @@ from .types import (
     TaskEscalate,
     TaskStatus,
     RoleType,
+    ROLE_TYPE_VALUES,
 )
 
+try:
+    # Rust-backed JSON encoder; several times faster than stdlib json on
+    # the large get_history/RoleAssignment payloads
+    import orjson
+
+    def _dumps_compact(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    def _dumps_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+
+    def _dumps_compact(obj: Any) -> str:
+        return json.dumps(obj)
+
+    def _dumps_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+
+# MCP stdio consumers are programs, so compact JSON is the default;
+# main() swaps in the pretty encoder when config.debug_pretty_json is set
+_dumps = _dumps_compact
+
 
 # Create server instance
 app = Server("team-mcp")
@@ -32,74 +61,133 @@ git_integration = None
 output_manager = None
 
 
+# Field tuples plus matching attrgetters: one C-level call pulls all
+# attributes for an encoder, and dict.update(zip(...)) builds the payload
+# without a per-field bytecode attribute load
+
+_RA_FIELDS = (
+    "role",
+    "role_type",
+    "iteration",
+    "instructions",
+    "rules",
+    "context",
+    "task",
+    "requirements",
+    "failure_context",
+    "design",
+    "feedback",
+    "reviewing",
+    "expected_output",
+)
+_RA_GET = operator.attrgetter(*_RA_FIELDS)
+
+_TP_FIELDS = ("role", "questions", "context", "partial_spec")
+_TP_GET = operator.attrgetter(*_TP_FIELDS)
+
+_TC_FIELDS = (
+    "success",
+    "summary",
+    "iterations",
+    "files_changed",
+    "requirements",
+    "design",
+    "git_branch",
+    "run_path",
+)
+_TC_GET = operator.attrgetter(*_TC_FIELDS)
+
+_TRO_FIELDS = ("failures", "last_rejection", "pattern", "suggestion")
+_TRO_GET = operator.attrgetter(*_TRO_FIELDS)
+
+_TE_FIELDS = ("reason", "iterations", "last_feedback", "suggestion")
+_TE_GET = operator.attrgetter(*_TE_FIELDS)
+
+_TS_FIELDS = (
+    "task",
+    "state",
+    "current_role",
+    "iteration",
+    "history",
+    "confirmed_requirements",
+    "current_design",
+)
+_TS_GET = operator.attrgetter(*_TS_FIELDS)
+
+
+def _enc_role_assignment(obj: RoleAssignment) -> dict:
+    out = {"type": "RoleAssignment"}
+    out.update(zip(_RA_FIELDS, _RA_GET(obj)))
+    return out
+
+
+def _enc_task_paused(obj: TaskPaused) -> dict:
+    out = {"type": "TaskPaused"}
+    out.update(zip(_TP_FIELDS, _TP_GET(obj)))
+    return out
+
+
+def _enc_task_complete(obj: TaskComplete) -> dict:
+    out = {"type": "TaskComplete"}
+    out.update(zip(_TC_FIELDS, _TC_GET(obj)))
+    return out
+
+
+def _enc_task_rebound_offer(obj: TaskReboundOffer) -> dict:
+    out = {"type": "TaskReboundOffer"}
+    out.update(zip(_TRO_FIELDS, _TRO_GET(obj)))
+    return out
+
+
+def _enc_task_escalate(obj: TaskEscalate) -> dict:
+    out = {"type": "TaskEscalate"}
+    out.update(zip(_TE_FIELDS, _TE_GET(obj)))
+    return out
+
+
+def _enc_task_status(obj: TaskStatus) -> dict:
+    out = {"type": "TaskStatus"}
+    out.update(zip(_TS_FIELDS, _TS_GET(obj)))
+    out["state"] = out["state"].value
+    return out
+
+
+def _enc_unknown(obj: Any) -> dict:
+    return {"type": "Unknown", "data": str(obj)}
+
+
+# Response encoder per concrete response type
+_ENCODERS: dict[type, Callable[[Any], dict]] = {
+    RoleAssignment: _enc_role_assignment,
+    TaskPaused: _enc_task_paused,
+    TaskComplete: _enc_task_complete,
+    TaskReboundOffer: _enc_task_rebound_offer,
+    TaskEscalate: _enc_task_escalate,
+    TaskStatus: _enc_task_status,
+}
+
+
+# Serialized payload per live response object, keyed by id(); a finalizer
+# on each cached object evicts its entry, so a recycled id can never
+# alias a dead one
+_SERIALIZED: dict[int, dict] = {}
+
+
 def serialize_response(obj: Any) -> dict:
     """Serialize response objects to JSON-compatible dicts."""
-    if isinstance(obj, RoleAssignment):
-        return {
-            "type": "RoleAssignment",
-            "role": obj.role,
-            "role_type": obj.role_type,
-            "iteration": obj.iteration,
-            "instructions": obj.instructions,
-            "rules": obj.rules,
-            "context": obj.context,
-            "task": obj.task,
-            "requirements": obj.requirements,
-            "failure_context": obj.failure_context,
-            "design": obj.design,
-            "feedback": obj.feedback,
-            "reviewing": obj.reviewing,
-            "expected_output": obj.expected_output,
-        }
-    elif isinstance(obj, TaskPaused):
-        return {
-            "type": "TaskPaused",
-            "role": obj.role,
-            "questions": obj.questions,
-            "context": obj.context,
-            "partial_spec": obj.partial_spec,
-        }
-    elif isinstance(obj, TaskComplete):
-        return {
-            "type": "TaskComplete",
-            "success": obj.success,
-            "summary": obj.summary,
-            "iterations": obj.iterations,
-            "files_changed": obj.files_changed,
-            "requirements": obj.requirements,
-            "design": obj.design,
-            "git_branch": obj.git_branch,
-            "run_path": obj.run_path,
-        }
-    elif isinstance(obj, TaskReboundOffer):
-        return {
-            "type": "TaskReboundOffer",
-            "failures": obj.failures,
-            "last_rejection": obj.last_rejection,
-            "pattern": obj.pattern,
-            "suggestion": obj.suggestion,
-        }
-    elif isinstance(obj, TaskEscalate):
-        return {
-            "type": "TaskEscalate",
-            "reason": obj.reason,
-            "iterations": obj.iterations,
-            "last_feedback": obj.last_feedback,
-            "suggestion": obj.suggestion,
-        }
-    elif isinstance(obj, TaskStatus):
-        return {
-            "type": "TaskStatus",
-            "task": obj.task,
-            "state": obj.state.value,
-            "current_role": obj.current_role,
-            "iteration": obj.iteration,
-            "history": obj.history,
-            "confirmed_requirements": obj.confirmed_requirements,
-            "current_design": obj.current_design,
-        }
-    else:
-        return {"type": "Unknown", "data": str(obj)}
+    key = id(obj)
+    cached = _SERIALIZED.get(key)
+    if cached is not None:
+        return cached
+
+    payload = _ENCODERS.get(type(obj), _enc_unknown)(obj)
+    try:
+        weakref.finalize(obj, _SERIALIZED.pop, key, None)
+    except TypeError:
+        # Not weak-referenceable; serve it uncached
+        return payload
+    _SERIALIZED[key] = payload
+    return payload
 
 
 @app.list_tools()
@@ -167,6 +255,14 @@ async def list_tools() -> list[Tool]:
                         "type": "integer",
                         "description": "Filter by iteration (optional)",
                     },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Skip this many matching entries (optional)",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Return at most this many entries (optional)",
+                    },
                 },
             },
         ),
@@ -186,121 +282,204 @@ async def list_tools() -> list[Tool]:
     ]
 
 
-@app.call_tool()
-async def call_tool(name: str, arguments: Any) -> list[TextContent]:
-    """Handle tool calls."""
-    global state_machine, git_integration, output_manager
-
-    try:
-        if name == "start_task":
-            task_description = arguments["task"]
-            result = state_machine.start_task(task_description)
-
-            # Initialize git and output
-            git_integration.start_run(state_machine.task.id)
-            output_manager.create_run(state_machine.task)
-
-            response = serialize_response(result)
-            return [TextContent(type="text", text=json.dumps(response, indent=2))]
-
-        elif name == "submit":
-            submission = arguments["submission"]
-            result = state_machine.submit(submission)
-
-            # Handle side effects based on result type
-            if isinstance(result, RoleAssignment):
-                # Write artifacts based on what was just submitted
-                if state_machine.task.confirmed_requirements:
-                    output_manager.write_requirements(state_machine.task)
-
-                if state_machine.task.current_design:
-                    output_manager.write_design(state_machine.task)
-
-                # Write iteration artifact for the last submission
-                if state_machine.task.submissions:
-                    last_submission = state_machine.task.submissions[-1]
-                    output_manager.write_iteration(state_machine.task, last_submission)
-
-                # Commit to git if in branch mode
-                if result.role_type == RoleType.IMPLEMENTER.value:
-                    files = submission.get("files_changed", [])
-                    git_integration.commit(
-                        "coder", submission.get("summary", ""), files
-                    )
-
-            elif isinstance(result, TaskComplete):
-                # Final commit and summary
-                git_integration.complete_run()
-
-                # Set git branch in result if available
-                if git_integration.get_branch_name():
-                    result.git_branch = git_integration.get_branch_name()
-
-                # Write final summary
-                output_manager.write_summary(state_machine.task, result)
-
-            response = serialize_response(result)
-            return [TextContent(type="text", text=json.dumps(response, indent=2))]
-
-        elif name == "resume":
-            user_input = arguments["input"]
-            result = state_machine.resume(user_input)
-
-            response = serialize_response(result)
-            return [TextContent(type="text", text=json.dumps(response, indent=2))]
-
-        elif name == "get_status":
-            result = state_machine.get_status()
-            response = serialize_response(result)
-            return [TextContent(type="text", text=json.dumps(response, indent=2))]
-
-        elif name == "get_history":
-            role_filter = arguments.get("role")
-            iteration_filter = arguments.get("iteration")
-
-            history = []
-            if state_machine.task:
-                for sub in state_machine.task.submissions:
-                    if role_filter and sub.role != role_filter:
-                        continue
-                    if iteration_filter and sub.iteration != iteration_filter:
-                        continue
-
-                    history.append(
-                        {
-                            "role": sub.role,
-                            "role_type": sub.role_type.value,
-                            "iteration": sub.iteration,
-                            "timestamp": sub.timestamp.isoformat(),
-                            "outcome": sub.outcome,
-                            "data": sub.data,
-                        }
-                    )
-
-            return [TextContent(type="text", text=json.dumps(history, indent=2))]
-
-        elif name == "abort":
-            reason = arguments.get("reason")
-            state_machine.abort(reason)
-            return [
-                TextContent(
-                    type="text", text=json.dumps({"status": "aborted"}, indent=2)
-                )
-            ]
-
+def _tool_errors(
+    handler: Callable[[Any], Awaitable[list[TextContent]]],
+) -> Callable[[Any], Awaitable[list[TextContent]]]:
+    """Wrap a tool handler so exceptions become error responses."""
+
+    @functools.wraps(handler)
+    async def wrapper(arguments: Any) -> list[TextContent]:
+        try:
+            return await handler(arguments)
+        except Exception as e:
+            return [TextContent(type="text", text=f"Error: {str(e)}")]
+
+    return wrapper
+
+
+@_tool_errors
+async def _handle_start_task(arguments: Any) -> list[TextContent]:
+    """Handle the start_task tool."""
+    task_description = arguments["task"]
+    result = state_machine.start_task(task_description)
+
+    # Initialize git and output off the event loop; the run dir is
+    # untracked so branch creation and artifact setup don't interact
+    await asyncio.gather(
+        asyncio.to_thread(git_integration.start_run, state_machine.task.id),
+        asyncio.to_thread(output_manager.create_run, state_machine.task),
+    )
+
+    response = serialize_response(result)
+    return [TextContent(type="text", text=_dumps(response))]
+
+
+@_tool_errors
+async def _handle_submit(arguments: Any) -> list[TextContent]:
+    """Handle the submit tool."""
+    submission = arguments["submission"]
+    result = state_machine.submit(submission)
+
+    # Handle side effects based on result type
+    if isinstance(result, RoleAssignment):
+        task = state_machine.task
+
+        # The artifact writes and the git commit are independent I/O;
+        # run them concurrently on the thread pool
+        side_effects = []
+
+        # Write artifacts based on what was just submitted
+        if task.confirmed_requirements:
+            side_effects.append(
+                asyncio.to_thread(output_manager.write_requirements, task)
+            )
+
+        if task.current_design:
+            side_effects.append(asyncio.to_thread(output_manager.write_design, task))
+
+        # Write iteration artifact for the last submission
+        if task.submissions:
+            last_submission = task.submissions[-1]
+            side_effects.append(
+                asyncio.to_thread(output_manager.write_iteration, task, last_submission)
+            )
+
+        # Commit to git if in branch mode
+        commit_coro = None
+        if result.role_type == RoleType.IMPLEMENTER.value:
+            files = submission.get("files_changed", [])
+            commit_coro = asyncio.to_thread(
+                git_integration.commit, "coder", submission.get("summary", ""), files
+            )
+            if files:
+                # An explicit file list stages only those paths, so the
+                # commit can't pick up in-flight artifact writes and may
+                # run alongside them
+                side_effects.append(commit_coro)
+                commit_coro = None
+
+        if side_effects:
+            await asyncio.gather(*side_effects)
+
+        # Without a file list the commit stages everything (git add -A),
+        # which would capture half-written run artifacts; it must wait
+        # for the writes above to land
+        if commit_coro is not None:
+            await commit_coro
+
+    elif isinstance(result, TaskComplete):
+        # Final commit and summary
+        await asyncio.to_thread(git_integration.complete_run)
+
+        # Set git branch in result if available
+        if git_integration.get_branch_name():
+            result.git_branch = git_integration.get_branch_name()
+
+        # Write final summary (after git_branch is set, so it's included)
+        await asyncio.to_thread(
+            output_manager.write_summary, state_machine.task, result
+        )
+
+    response = serialize_response(result)
+    return [TextContent(type="text", text=_dumps(response))]
+
+
+@_tool_errors
+async def _handle_resume(arguments: Any) -> list[TextContent]:
+    """Handle the resume tool."""
+    user_input = arguments["input"]
+    result = state_machine.resume(user_input)
+
+    response = serialize_response(result)
+    return [TextContent(type="text", text=_dumps(response))]
+
+
+@_tool_errors
+async def _handle_get_status(arguments: Any) -> list[TextContent]:
+    """Handle the get_status tool."""
+    result = state_machine.get_status()
+    response = serialize_response(result)
+    return [TextContent(type="text", text=_dumps(response))]
+
+
+@_tool_errors
+async def _handle_get_history(arguments: Any) -> list[TextContent]:
+    """Handle the get_history tool."""
+    role_filter = arguments.get("role")
+    iteration_filter = arguments.get("iteration")
+    offset = arguments.get("offset", 0)
+    limit = arguments.get("limit")
+
+    history = []
+    if state_machine.task:
+        # Pick the filter predicate once instead of re-testing which
+        # filters are set for every submission; serialization stays lazy
+        # so only the requested window is materialized as dicts
+        subs = state_machine.task.submissions
+        if role_filter and iteration_filter:
+            matching = (
+                s
+                for s in subs
+                if s.role == role_filter and s.iteration == iteration_filter
+            )
+        elif role_filter:
+            matching = (s for s in subs if s.role == role_filter)
+        elif iteration_filter:
+            matching = (s for s in subs if s.iteration == iteration_filter)
         else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+            matching = iter(subs)
+
+        stop = None if limit is None else offset + limit
+        history = [
+            {
+                "role": sub.role,
+                "role_type": ROLE_TYPE_VALUES[sub.role_type],
+                "iteration": sub.iteration,
+                "timestamp": sub.timestamp_iso,
+                "outcome": sub.outcome,
+                "data": sub.data,
+            }
+            for sub in itertools.islice(matching, offset, stop)
+        ]
+
+    return [TextContent(type="text", text=_dumps(history))]
+
+
+@_tool_errors
+async def _handle_abort(arguments: Any) -> list[TextContent]:
+    """Handle the abort tool."""
+    reason = arguments.get("reason")
+    state_machine.abort(reason)
+    return [TextContent(type="text", text=_dumps({"status": "aborted"}))]
+
+
+_TOOL_HANDLERS: dict[str, Callable[[Any], Awaitable[list[TextContent]]]] = {
+    "start_task": _handle_start_task,
+    "submit": _handle_submit,
+    "resume": _handle_resume,
+    "get_status": _handle_get_status,
+    "get_history": _handle_get_history,
+    "abort": _handle_abort,
+}
 
-    except Exception as e:
-        return [TextContent(type="text", text=f"Error: {str(e)}")]
+
+@app.call_tool()
+async def call_tool(name: str, arguments: Any) -> list[TextContent]:
+    """Handle tool calls via the handler table."""
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    return await handler(arguments)
 
 
 async def main():
     """Main entry point for the MCP server."""
-    global config, state_machine, git_integration, output_manager
+    global config, state_machine, git_integration, output_manager, _dumps
 
     # Load configuration
     config = load_config()
+    if config.debug_pretty_json:
+        _dumps = _dumps_pretty
 
     # Initialize components
     state_machine = StateMachine(config)
@@ -316,6 +495,14 @@ async def main():
 
 def run():
     """CLI entry point."""
+    try:
+        # Faster event loop for the stdio transport; purely optional
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
 
 
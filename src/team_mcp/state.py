@@ -3,13 +3,16 @@
 from datetime import datetime
 from typing import Optional, Union
 import re
+import time
 
 from .types import (
     Task,
     TaskState,
     RoleType,
+    ROLE_TYPE_VALUES,
     Submission,
     RoleAssignment,
+    ImplementerSubmission,
     TaskPaused,
     TaskComplete,
     TaskReboundOffer,
@@ -21,6 +24,15 @@ from .types import (
 from .agents import load_all_agents
 from .config import get_context_files, expand_glob_patterns
 
+# Task-id slug characters to collapse into dashes. ASCII input goes
+# through a translation table (one C-level pass); anything else falls
+# back to the regex, and dash runs are collapsed afterwards either way.
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_SLUG_TRANS = str.maketrans(
+    {c: "-" for c in map(chr, range(128)) if not ("a" <= c <= "z" or "0" <= c <= "9")}
+)
+_DASH_RUN_RE = re.compile(r"-{2,}")
+
 
 class StateMachine:
     """Manages task state and workflow transitions."""
@@ -30,11 +42,28 @@ class StateMachine:
         self.task: Optional[Task] = None
         self.agents: dict[str, Agent] = {}
 
+        # First workflow index per role type, so rejection/rebound paths
+        # don't rescan the sequence
+        self._role_index_by_type: dict[RoleType, int] = {}
+        for i, role in enumerate(config.workflow.sequence):
+            self._role_index_by_type.setdefault(role.type, i)
+
+        # Expanded context globs per role: role -> (monotonic ts, files)
+        self._context_cache: dict[str, tuple[float, tuple[str, ...]]] = {}
+
+        # Assignments already built for the current task, keyed on the
+        # inputs that shape them; cleared on every start_task
+        self._assignment_cache: dict[tuple, RoleAssignment] = {}
+
     def _generate_task_id(self, description: str) -> str:
         """Generate a task ID from timestamp and description."""
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         # Create slug from description
-        slug = re.sub(r"[^a-z0-9]+", "-", description.lower())
+        lowered = description.lower()
+        if lowered.isascii():
+            slug = _DASH_RUN_RE.sub("-", lowered.translate(_SLUG_TRANS))
+        else:
+            slug = _SLUG_RE.sub("-", lowered)
         slug = slug[:50].strip("-")
         return f"{timestamp}_{slug}"
 
@@ -45,37 +74,88 @@ class StateMachine:
         if not self.task:
             return
 
+        now = datetime.now()
         submission = Submission(
             role=role,
             role_type=role_type,
             iteration=self.task.iteration,
-            timestamp=datetime.now(),
+            timestamp=now,
             data=data,
             outcome=outcome,
+            timestamp_iso=now.isoformat(),
         )
         self.task.submissions.append(submission)
+        self.task.submissions_by_type.setdefault(role_type, []).append(
+            len(self.task.submissions) - 1
+        )
+
+        # Fold coder file lists into the running set as they arrive, so
+        # get_files_changed never rescans the history
+        if role_type is RoleType.IMPLEMENTER and "files_changed" in data:
+            self.task._files_changed.update(dict.fromkeys(data["files_changed"]))
+
+        # Maintain the serialized history view get_status hands out, so
+        # status polls don't rebuild it from scratch
+        self.task.serialized_submissions.append(
+            {
+                "role": role,
+                "type": ROLE_TYPE_VALUES[role_type],
+                "iteration": submission.iteration,
+                "outcome": outcome,
+                "timestamp": submission.timestamp_iso,
+                "data": data,
+            }
+        )
+
+        # Track gatekeeper rejections as they arrive so the failure-context
+        # builders don't rescan the full history
+        if role_type == RoleType.GATEKEEPER and not data.get("approved"):
+            self.task.rejections.append(submission)
+            # Keep the word-frequency tally current for pattern detection
+            self.task.rejection_word_counts.update(
+                word
+                for word in data.get("reason", "").lower().split()
+                if len(word) > 5  # Only significant words
+            )
 
     def _make_role_assignment(
         self,
         role: str,
         role_type: RoleType,
-        reviewing: Optional[dict] = None,
+        reviewing: Optional[ImplementerSubmission] = None,
         feedback: Optional[str] = None,
     ) -> RoleAssignment:
         """Create a RoleAssignment for the given role."""
         if not self.task:
             raise ValueError("No active task")
 
+        # Identical requests (e.g. repeated status-driven re-prompts within
+        # an iteration) reuse the already-built assignment. Identity of the
+        # requirements/design/reviewing objects stands in for their content:
+        # the workflow only ever replaces them wholesale.
+        cache_key = (
+            role,
+            self.task.iteration,
+            id(self.task.confirmed_requirements),
+            id(self.task.current_design),
+            id(self.task.last_rejection),
+            id(reviewing),
+            feedback,
+        )
+        cached = self._assignment_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         agent = self.agents[role]
 
-        # Get context files for this role
-        context_patterns = get_context_files(role, self.config)
-        context_files = expand_glob_patterns(context_patterns)
+        # Get context files for this role; glob expansion hits the disk, so
+        # repeated assignments to the same role reuse a short-lived cache
+        context_files = self._get_role_context(role)
 
         # Build role assignment based on type
         assignment = RoleAssignment(
             role=role,
-            role_type=role_type.value,
+            role_type=ROLE_TYPE_VALUES[role_type],
             iteration=self.task.iteration,
             instructions=agent.prompt,
             rules=self.config.rules,
@@ -104,46 +184,42 @@ class StateMachine:
             assignment.requirements = self.task.confirmed_requirements
             assignment.design = self.task.current_design
 
+        self._assignment_cache[cache_key] = assignment
         return assignment
 
+    def _get_role_context(self, role: str) -> tuple[str, ...]:
+        """Expand context globs for a role, cached for context_cache_ttl."""
+        now = time.monotonic()
+        cached = self._context_cache.get(role)
+        if cached is not None and now - cached[0] < self.config.context_cache_ttl:
+            return cached[1]
+
+        context_patterns = get_context_files(role, self.config)
+        context_files = tuple(expand_glob_patterns(context_patterns))
+        self._context_cache[role] = (now, context_files)
+        return context_files
+
     def _build_failure_context(self) -> str:
         """Build context about repeated failures for architect rebound."""
         if not self.task:
             return ""
 
-        failures = []
-        for sub in self.task.submissions:
-            if sub.role_type == RoleType.GATEKEEPER and not sub.data.get("approved"):
-                failures.append(
-                    f"Iteration {sub.iteration}: {sub.data.get('reason', 'No reason given')}"
-                )
-
-        return "\n".join(failures)
+        return "\n".join(
+            f"Iteration {sub.iteration}: {sub.data.get('reason', 'No reason given')}"
+            for sub in self.task.rejections
+        )
 
     def _detect_failure_pattern(self) -> Optional[str]:
         """Detect patterns in repeated failures."""
         if not self.task:
             return None
 
-        # Simple pattern detection - look for repeated keywords
-        rejection_reasons = []
-        for sub in self.task.submissions:
-            if sub.role_type == RoleType.GATEKEEPER and not sub.data.get("approved"):
-                rejection_reasons.append(sub.data.get("reason", ""))
-
-        # Check for common words
-        if len(rejection_reasons) >= 2:
-            words = {}
-            for reason in rejection_reasons:
-                for word in reason.lower().split():
-                    if len(word) > 5:  # Only significant words
-                        words[word] = words.get(word, 0) + 1
-
-            # Find most common word
-            if words:
-                max_word = max(words.items(), key=lambda x: x[1])
-                if max_word[1] >= 2:
-                    return f"Repeated issue with: {max_word[0]}"
+        # Simple pattern detection - the word tally is maintained as
+        # rejections are recorded, so just read off the most common word
+        if len(self.task.rejections) >= 2:
+            most_common = self.task.rejection_word_counts.most_common(1)
+            if most_common and most_common[0][1] >= 2:
+                return f"Repeated issue with: {most_common[0][0]}"
 
         return None
 
@@ -156,6 +232,7 @@ class StateMachine:
             description=description,
             state=TaskState.IN_PROGRESS,
         )
+        self._assignment_cache.clear()
 
         # Load agents for workflow
         self.agents = load_all_agents(self.config.workflow.sequence)
@@ -183,16 +260,17 @@ class StateMachine:
         current_type = current_workflow_role.type
 
         # Handle submission based on role type
-        if current_type == RoleType.ANALYST:
-            return self._handle_analyst_submission(submission)
-        elif current_type == RoleType.DESIGNER:
-            return self._handle_designer_submission(submission)
-        elif current_type == RoleType.IMPLEMENTER:
-            return self._handle_implementer_submission(submission)
-        elif current_type == RoleType.GATEKEEPER:
-            return self._handle_gatekeeper_submission(submission)
-        else:
-            raise ValueError(f"Unknown role type: {current_type}")
+        match current_type:
+            case RoleType.ANALYST:
+                return self._handle_analyst_submission(submission)
+            case RoleType.DESIGNER:
+                return self._handle_designer_submission(submission)
+            case RoleType.IMPLEMENTER:
+                return self._handle_implementer_submission(submission)
+            case RoleType.GATEKEEPER:
+                return self._handle_gatekeeper_submission(submission)
+            case _:
+                raise ValueError(f"Unknown role type: {current_type}")
 
     def _handle_analyst_submission(
         self, submission: dict
@@ -206,7 +284,7 @@ class StateMachine:
             )
             return TaskPaused(
                 role=self.task.current_role,
-                questions=submission["questions"],
+                questions=tuple(submission["questions"]),
                 context=submission.get("context", ""),
                 partial_spec=submission.get("partial_spec"),
             )
@@ -260,7 +338,7 @@ class StateMachine:
             return self._handle_rejection(submission)
 
     def _advance_to_next_role(
-        self, reviewing: Optional[dict] = None
+        self, reviewing: Optional[ImplementerSubmission] = None
     ) -> Union[RoleAssignment, TaskComplete]:
         """Advance to the next role in the workflow."""
         if not self.task:
@@ -303,12 +381,7 @@ class StateMachine:
             return self._escalate_task(rejection)
 
         # Find the implementer role to go back to
-        implementer_index = None
-        for i, role in enumerate(self.config.workflow.sequence):
-            if role.type == RoleType.IMPLEMENTER:
-                implementer_index = i
-                break
-
+        implementer_index = self._role_index_by_type.get(RoleType.IMPLEMENTER)
         if implementer_index is None:
             raise ValueError("No implementer in workflow")
 
@@ -354,35 +427,30 @@ class StateMachine:
         if not self.task:
             raise ValueError("No active task")
 
-        if self.task.state == TaskState.PAUSED:
-            # User answered analyst questions
-            self.task.user_answers = user_input
-            self.task.state = TaskState.IN_PROGRESS
+        match self.task.state:
+            case TaskState.PAUSED:
+                # User answered analyst questions
+                self.task.user_answers = user_input
+                self.task.state = TaskState.IN_PROGRESS
 
-            # Record the answers
-            self._record_submission(
-                self.task.current_role,
-                RoleType.ANALYST,
-                {"user_answers": user_input},
-                outcome="resumed",
-            )
+                # Record the answers
+                self._record_submission(
+                    self.task.current_role,
+                    RoleType.ANALYST,
+                    {"user_answers": user_input},
+                    outcome="resumed",
+                )
 
-            # Move to next role
-            return self._advance_to_next_role()
+                # Move to next role
+                return self._advance_to_next_role()
 
-        elif self.task.state == TaskState.REBOUND_OFFERED:
-            if user_input.lower() in ("yes", "y"):
+            case TaskState.REBOUND_OFFERED if user_input.lower() in ("yes", "y"):
                 # Go back to architect
                 self.task.coder_failures = 0  # Reset counter
                 self.task.state = TaskState.IN_PROGRESS
 
                 # Find architect in workflow
-                architect_index = None
-                for i, role in enumerate(self.config.workflow.sequence):
-                    if role.type == RoleType.DESIGNER:
-                        architect_index = i
-                        break
-
+                architect_index = self._role_index_by_type.get(RoleType.DESIGNER)
                 if architect_index is None:
                     raise ValueError("No designer in workflow")
 
@@ -394,17 +462,13 @@ class StateMachine:
                 return self._make_role_assignment(
                     self.task.current_role, RoleType.DESIGNER
                 )
-            else:
+
+            case TaskState.REBOUND_OFFERED:
                 # Continue with coder
                 self.task.state = TaskState.IN_PROGRESS
 
                 # Find implementer
-                implementer_index = None
-                for i, role in enumerate(self.config.workflow.sequence):
-                    if role.type == RoleType.IMPLEMENTER:
-                        implementer_index = i
-                        break
-
+                implementer_index = self._role_index_by_type.get(RoleType.IMPLEMENTER)
                 if implementer_index is None:
                     raise ValueError("No implementer in workflow")
 
@@ -421,8 +485,9 @@ class StateMachine:
                 return self._make_role_assignment(
                     self.task.current_role, RoleType.IMPLEMENTER, feedback=feedback
                 )
-        else:
-            raise ValueError(f"Cannot resume task in state: {self.task.state}")
+
+            case _:
+                raise ValueError(f"Cannot resume task in state: {self.task.state}")
 
     def get_status(self) -> TaskStatus:
         """Get current task status."""
@@ -432,26 +497,12 @@ class StateMachine:
                 state=TaskState.NOT_STARTED,
             )
 
-        # Build history
-        history = []
-        for sub in self.task.submissions:
-            history.append(
-                {
-                    "role": sub.role,
-                    "type": sub.role_type.value,
-                    "iteration": sub.iteration,
-                    "outcome": sub.outcome,
-                    "timestamp": sub.timestamp.isoformat(),
-                    "data": sub.data,
-                }
-            )
-
         return TaskStatus(
             task=self.task.description,
             state=self.task.state,
             current_role=self.task.current_role,
             iteration=self.task.iteration,
-            history=history,
+            history=self.task.serialized_submissions,
             confirmed_requirements=self.task.confirmed_requirements,
             current_design=self.task.current_design,
         )
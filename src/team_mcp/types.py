@@ -1,12 +1,16 @@
 """Core types and data models for Team MCP."""
 
+import sys
+import time
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
-from typing import Optional, Any
+from enum import StrEnum
+from pathlib import Path
+from typing import NamedTuple, Optional, Any, TypedDict
 
 
-class TaskState(Enum):
+class TaskState(StrEnum):
     """States a task can be in."""
 
     NOT_STARTED = "not_started"
@@ -18,7 +22,7 @@ class TaskState(Enum):
     ABORTED = "aborted"
 
 
-class RoleType(Enum):
+class RoleType(StrEnum):
     """Types of roles in the workflow."""
 
     ANALYST = "analyst"  # Clarify requirements
@@ -27,7 +31,21 @@ class RoleType(Enum):
     GATEKEEPER = "gatekeeper"  # Review and approve/reject
 
 
-@dataclass
+# Member -> wire string, precomputed so hot serialization paths skip the
+# enum's .value descriptor lookup
+ROLE_TYPE_VALUES: dict[RoleType, str] = {member: member.value for member in RoleType}
+
+
+class ImplementerSubmission(TypedDict, total=False):
+    """Shape of a coder submission as handed to the gatekeeper."""
+
+    summary: str
+    files_changed: list[str]
+    proof: str
+    concerns: str
+
+
+@dataclass(eq=False, repr=False, slots=True, weakref_slot=True)
 class RoleAssignment:
     """Returned when Claude should adopt a new role."""
 
@@ -36,8 +54,8 @@ class RoleAssignment:
     iteration: int  # Current iteration number
 
     instructions: str  # System prompt for this role
-    rules: list[str]  # Global rules that apply
-    context: list[str]  # Relevant files/docs loaded
+    rules: tuple[str, ...]  # Global rules that apply
+    context: tuple[str, ...]  # Relevant files/docs loaded
 
     # For analyst:
     task: Optional[str] = None  # Original task to analyze
@@ -51,22 +69,27 @@ class RoleAssignment:
     feedback: Optional[str] = None  # Feedback from previous rejection
 
     # For gatekeeper:
-    reviewing: Optional[dict] = None  # The submission to review
+    reviewing: Optional[ImplementerSubmission] = None  # The submission to review
 
     expected_output: dict = field(default_factory=dict)  # Schema of expected submission
 
+    def __post_init__(self) -> None:
+        # Role names recur across every assignment and submission; interning
+        # makes the frequent equality checks pointer comparisons
+        self.role = sys.intern(self.role)
+
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class TaskPaused:
     """Returned when analyst needs user input."""
 
     role: str  # Which analyst paused
-    questions: list[str]  # Questions needing answers
+    questions: tuple[str, ...]  # Questions needing answers
     context: str  # What analyst understood so far
     partial_spec: Optional[str] = None  # Any requirements already clear
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class TaskReboundOffer:
     """Returned when repeated failures suggest design issue."""
 
@@ -76,7 +99,7 @@ class TaskReboundOffer:
     suggestion: str = "Consider consulting architect to revisit approach"
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class TaskComplete:
     """Returned when all gates pass."""
 
@@ -92,7 +115,7 @@ class TaskComplete:
     run_path: str = ""  # Path to .team/runs/...
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class TaskEscalate:
     """Returned when max iterations reached without resolution."""
 
@@ -102,7 +125,7 @@ class TaskEscalate:
     suggestion: str  # What user might do
 
 
-@dataclass
+@dataclass(eq=False, repr=False, slots=True, weakref_slot=True)
 class TaskStatus:
     """Current status of a task."""
 
@@ -115,7 +138,7 @@ class TaskStatus:
     current_design: Optional[str] = None  # If architect completed
 
 
-@dataclass
+@dataclass(eq=False, repr=False, slots=True)
 class Submission:
     """A submission from a role."""
 
@@ -125,17 +148,20 @@ class Submission:
     timestamp: datetime
     data: dict
     outcome: Optional[str] = None  # "confirmed", "approved", "rejected", etc.
+    timestamp_iso: str = ""  # ISO form of timestamp, precomputed for serialization
 
+    def __post_init__(self) -> None:
+        self.role = sys.intern(self.role)
 
-@dataclass
-class WorkflowRole:
+
+class WorkflowRole(NamedTuple):
     """A role in the workflow sequence."""
 
     role: str  # Role name (e.g., "ba", "architect")
     type: RoleType  # Role type
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowConfig:
     """Workflow configuration."""
 
@@ -145,7 +171,7 @@ class WorkflowConfig:
     on_max_iterations: str = "escalate"  # "escalate" | "fail"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GitConfig:
     """Git integration configuration."""
 
@@ -154,7 +180,7 @@ class GitConfig:
     commit_message_format: str = "team({role}): {summary}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OutputConfig:
     """Output configuration."""
 
@@ -162,39 +188,60 @@ class OutputConfig:
     verbose: bool = True
 
 
-@dataclass
+# Shared defaults: frozen configs are safe to alias, so Configs built
+# without explicit git/output sections all point at one instance
+_DEFAULT_GIT = GitConfig()
+_DEFAULT_OUTPUT = OutputConfig()
+
+
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration for a custom agent."""
 
     type: RoleType
     stance: Optional[str] = None
-    context: list[str] = field(default_factory=list)
+    context: tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main configuration object."""
 
     version: int
     workflow: WorkflowConfig
-    rules: list[str] = field(default_factory=list)
+    rules: tuple[str, ...] = ()
     context: dict[str, list[str]] = field(default_factory=dict)
-    git: GitConfig = field(default_factory=GitConfig)
-    output: OutputConfig = field(default_factory=OutputConfig)
+    git: GitConfig = field(default_factory=lambda: _DEFAULT_GIT)
+    output: OutputConfig = field(default_factory=lambda: _DEFAULT_OUTPUT)
     agents: dict[str, AgentConfig] = field(default_factory=dict)
+    debug_pretty_json: bool = False  # Pretty-print MCP responses (debugging)
+    context_cache_ttl: float = 5.0  # Seconds to reuse expanded context globs
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     """An agent with its prompt and configuration."""
 
     name: str
     type: RoleType
-    prompt: str
+    prompt_path: Path
     config: Optional[AgentConfig] = None
+    _prompt_bytes: Optional[bytes] = None  # Raw prompt file, read lazily
+
+    @property
+    def prompt(self) -> str:
+        """The agent's system prompt, read lazily on first access.
 
+        Only the raw bytes are kept; decoding per access trades a little
+        CPU for not holding a second, decoded copy of every prompt. The
+        assignment cache upstream makes repeat decodes rare.
+        """
+        if self._prompt_bytes is None:
+            self._prompt_bytes = self.prompt_path.read_bytes()
+        return self._prompt_bytes.decode("utf-8")
 
-@dataclass
+
+@dataclass(eq=False, repr=False, slots=True)
 class Task:
     """A task being executed."""
 
@@ -209,17 +256,33 @@ class Task:
     current_design: Optional[str] = None
     user_answers: Optional[str] = None
 
-    submissions: list[Submission] = field(default_factory=list)
+    # deque: appends never trigger a list resize/copy as history grows
+    submissions: deque[Submission] = field(default_factory=deque)
+    serialized_submissions: list[dict] = field(default_factory=list)  # History view
+    # Indices into submissions, grouped by role type as they're recorded
+    submissions_by_type: dict[RoleType, list[int]] = field(default_factory=dict)
+    rejections: list[Submission] = field(default_factory=list)  # Gatekeeper rejections
+    rejection_word_counts: Counter = field(default_factory=Counter)
+    # Changed files from coder submissions; dict keys dedupe while keeping
+    # first-seen order, unlike a set
+    _files_changed: dict[str, None] = field(default_factory=dict)
     coder_failures: int = 0
     last_rejection: Optional[dict] = None
 
-    created_at: datetime = field(default_factory=datetime.now)
+    # Raw clock reading; time_ns() skips datetime construction on the
+    # start_task path, and created_at materializes a datetime on demand
+    _created_at_ns: int = field(default_factory=time.time_ns)
     completed_at: Optional[datetime] = None
 
+    @property
+    def created_at(self) -> datetime:
+        """When the task was created, as a datetime."""
+        return datetime.fromtimestamp(self._created_at_ns / 1e9)
+
+    def __repr__(self) -> str:
+        return f"Task(id={self.id!r}, state={self.state!r}, iteration={self.iteration})"
+
     def get_files_changed(self) -> list[str]:
-        """Extract list of files changed from coder submissions."""
-        files = []
-        for sub in self.submissions:
-            if sub.role_type == RoleType.IMPLEMENTER and "files_changed" in sub.data:
-                files.extend(sub.data["files_changed"])
-        return list(set(files))  # Deduplicate
+        """List the files changed across coder submissions, deduplicated,
+        in first-seen order."""
+        return list(self._files_changed)